@@ -1,44 +1,583 @@
 #!/usr/bin/env python3
 """
 Create GitHub Issues from the tracker database.
-Uses the gh CLI to create issues with proper labels and milestones.
+Talks to the GitHub REST API over keep-alive connections, using the gh CLI
+only to look up the auth token.
 """
 
+import atexit
 import sqlite3
 import subprocess
+import http.client
+import itertools
 import json
+import os
+import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import parse_qs, quote, urlsplit
 
 DB_PATH = Path(__file__).parent.parent / "implementation_tracker.db"
 REPO = "eliahoco/ProjectsManagerWebV2"
+REPO_OWNER, REPO_NAME = REPO.split("/")
 
-# Rate limiting
-DELAY_BETWEEN_ISSUES = 1  # seconds
+# gh CLI, resolved once; the environment keeps it non-interactive
+GH = shutil.which("gh")
+GH_ENV = {**os.environ, "GH_PROMPT_DISABLED": "1", "NO_COLOR": "1"}
+
+# GitHub REST API
+API_HOST = "api.github.com"
+API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+    "User-Agent": "ProjectsManagerWebV2-scripts",
+}
+
+# Methods that are safe to resend once the server may have seen the request
+IDEMPOTENT_METHODS = {"GET", "PUT"}
+
+# Status reported for a request that got no HTTP response at all (timeout,
+# dropped connection), so callers handle it like any other failed request
+NO_RESPONSE = 599
+
+# Issues created per GraphQL request (GitHub's content-creation limits
+# make larger batches counterproductive)
+GRAPHQL_BATCH_SIZE = 5
+
+PRIORITY_LABELS = {
+    priority: f"priority:{priority.lower()}"
+    for priority in ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+}
+
+# Issue bodies, filled in with str.format_map
+EPIC_BODY_TEMPLATE = """# {title}
+
+## Description
+{description}
+
+## Scope
+- Stories: {stories}
+- Tasks: {tasks}
+
+## Progress
+Track progress in the implementation tracker:
+```bash
+python scripts/tracker.py show {epic_id}
+```
+
+---
+*This issue tracks the overall Epic. Individual tasks have their own issues.*
+"""
+
+TASK_BODY_TEMPLATE = """## {title}
+
+**Epic:** {epic_id} - {epic_title}
+**Story:** {story_id} - {story_title}
+**Estimated:** {hours} hours
+
+### Description
+{description}
+
+### Subtasks
+{subtask_list}
+
+### Tracker
+```bash
+# Start working on this task
+python scripts/tracker.py start {task_id}
+
+# Mark as complete
+python scripts/tracker.py done {task_id}
+```
+
+---
+*See IMPLEMENTATION_PLAN_DETAILED.md for full technical details.*
+"""
+
+# Concurrency: worker threads, and how many of them may have a request in
+# flight at once (GitHub penalises bursts of parallel writes)
+MAX_WORKERS = 8
+MAX_CONCURRENT_REQUESTS = 5
+
+# Created issue numbers are written to the database in groups of this size
+DB_FLUSH_SIZE = 32
+
+# Task rows are read from the database in chunks of this size
+DB_FETCH_SIZE = 256
+
+
+def _open_db():
+    """Open the tracker database with the connection pragmas applied."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+    """)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+_conn = None
+
+
+def get_conn():
+    """Return the process-wide database connection, opening it on first use.
+
+    Only the main thread uses it; pool workers never touch the database.
+    """
+    global _conn
+    if _conn is None:
+        _conn = _open_db()
+        atexit.register(_conn.close)
+    return _conn
 
 
 def run_gh_command(args, input_text=None):
     """Run a gh CLI command and return the result."""
-    cmd = ["gh"] + args
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            input=input_text
-        )
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
-            return None
-        return result.stdout.strip()
-    except FileNotFoundError:
+    if GH is None:
         print("Error: gh CLI not found. Install with: brew install gh")
         sys.exit(1)
+    result = subprocess.run(
+        [GH, *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=False,
+        env=GH_ENV,
+        input=input_text
+    )
+    if result.returncode != 0:
+        print(f"Error: {result.stderr}")
+        return None
+    return result.stdout.strip()
+
+
+class RateLimiter:
+    """Pace API calls from GitHub's rate-limit headers.
+
+    Requests go out back to back until the primary quota runs low or the
+    server asks us to back off, so the unthrottled case never sleeps.
+    """
+
+    LOW_REMAINING = 50
+    MAX_RETRIES = 5
+    SECONDARY_INITIAL_DELAY = 2  # seconds
+    SECONDARY_MAX_DELAY = 90  # seconds
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_ts = None
+        self.secondary_delay = 0
+        self._lock = threading.Lock()
+
+    def low(self):
+        """Return True while the primary quota is nearly used up."""
+        return (
+            self.remaining is not None
+            and self.remaining < self.LOW_REMAINING
+            and (self.reset_ts or 0) > time.time()
+        )
+
+    def wait(self):
+        """Spread the remaining quota evenly until the reset time."""
+        if not self.low():
+            return
+        delay = (self.reset_ts or 0) - time.time()
+        if delay > 0:
+            time.sleep(delay / max(self.remaining, 1))
+
+    def update(self, headers):
+        """Record the quota reported by the last response."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_ts = int(reset)
+
+    def retry_delay(self, status, headers, raw):
+        """Return seconds to wait before retrying, or None if not throttled."""
+        if status not in (403, 429):
+            self.secondary_delay = 0
+            return None
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        if b"secondary rate limit" in raw.lower():
+            with self._lock:
+                self.secondary_delay = min(
+                    self.secondary_delay * 1.5 or self.SECONDARY_INITIAL_DELAY,
+                    self.SECONDARY_MAX_DELAY,
+                )
+                return self.secondary_delay
+        if headers.get("X-RateLimit-Remaining") == "0" and self.reset_ts:
+            return max(self.reset_ts - time.time(), 1)
+        return None
+
+
+class TokenPool:
+    """Hand out API tokens round-robin, each with its own RateLimiter.
+
+    GitHub counts quota per token, so spreading requests over several
+    tokens raises throughput. A token whose quota is running low is passed
+    over while another still has room.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.limiters = {token: RateLimiter() for token in tokens}
+        self.headers = {
+            token: dict(API_HEADERS, Authorization=f"Bearer {token}")
+            for token in tokens
+        }
+        self._cycle = itertools.cycle(tokens)
+        self._lock = threading.Lock()
+
+    def next(self):
+        """Return the next token with quota left (or just the next one)."""
+        with self._lock:
+            for _ in self.tokens:
+                token = next(self._cycle)
+                if not self.limiters[token].low():
+                    return token
+            return next(self._cycle)
+
+    def has_spare(self):
+        """Return True if some token is not running low on quota."""
+        return any(not limiter.low() for limiter in self.limiters.values())
+
+
+_token = None
+_token_pool = None
+_local = threading.local()  # one keep-alive connection per thread
+_request_slots = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Threads that run API calls concurrently; update_detailed_descriptions.py shares it
+worker_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+
+def get_token():
+    """Return the GitHub token, looked up once per run.
+
+    GITHUB_TOKEN or GH_TOKEN wins when set, so CI never needs the gh CLI;
+    otherwise the token comes from 'gh auth token'.
+    """
+    global _token
+    if _token is None:
+        _token = (
+            os.environ.get("GITHUB_TOKEN")
+            or os.environ.get("GH_TOKEN")
+            or run_gh_command(["auth", "token"])
+        )
+        if not _token:
+            print("Error: no GitHub token. Set GITHUB_TOKEN or run: gh auth login")
+            sys.exit(1)
+    return _token
+
+
+def get_token_pool():
+    """Return the pool of API tokens, built once per run.
+
+    GH_TOKENS may hold several comma-separated tokens to rotate through;
+    otherwise the pool holds the single token from get_token().
+    """
+    global _token_pool
+    if _token_pool is None:
+        tokens = [t.strip() for t in os.environ.get("GH_TOKENS", "").split(",") if t.strip()]
+        _token_pool = TokenPool(tokens or [get_token()])
+    return _token_pool
+
+
+def _close_connection():
+    """Close this thread's keep-alive connection; the next request opens a new one."""
+    connection = getattr(_local, "connection", None)
+    if connection is not None:
+        connection.close()
+        _local.connection = None
+
+
+def _send(method, path, body, headers):
+    """Send one request over this thread's connection and read the response.
+
+    A reused keep-alive connection the server has since closed is replaced and
+    the request resent once, but only while the request cannot have been acted
+    on: the send itself failed, or the method is idempotent. Timeouts and other
+    errors are raised as they are, so a createIssue batch is never sent twice.
+    """
+    connection = getattr(_local, "connection", None)
+    reused = connection is not None
+    with _request_slots:
+        while True:
+            if connection is None:
+                connection = _local.connection = http.client.HTTPSConnection(API_HOST, timeout=30)
+            sent = False
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                sent = True
+                response = connection.getresponse()
+                return response.status, response.headers, response.read()
+            except (http.client.HTTPException, OSError) as e:
+                _close_connection()
+                connection = None
+                # RemoteDisconnected is a ConnectionResetError: closed before any response
+                stale = isinstance(e, (ConnectionResetError, BrokenPipeError))
+                if not (reused and stale and (not sent or method in IDEMPOTENT_METHODS)):
+                    raise
+                reused = False
+
+
+def github_request(method, path, payload=None):
+    """Send a GitHub API request, waiting out any rate limiting.
+
+    Returns a (status, headers, data) tuple where data is the decoded JSON
+    body, or None when the body is not JSON. A request that gets no response
+    comes back with status NO_RESPONSE and the error text as data.
+    """
+    tokens = get_token_pool()
+    body = None
+    extra_headers = {}
+    if payload is not None:
+        body = json.dumps(payload)
+        extra_headers["Content-Type"] = "application/json"
+
+    for _ in range(RateLimiter.MAX_RETRIES):
+        token = tokens.next()
+        limiter = tokens.limiters[token]
+        limiter.wait()
+        headers = dict(tokens.headers[token], **extra_headers)
+        try:
+            status, response_headers, raw = _send(method, path, body, headers)
+        except (http.client.HTTPException, OSError) as e:
+            return NO_RESPONSE, {}, str(e) or type(e).__name__
+        limiter.update(response_headers)
+        delay = limiter.retry_delay(status, response_headers, raw)
+        if delay is None:
+            break
+        if limiter.low() and tokens.has_spare():
+            continue  # this token's quota is spent; retry on another one
+        print(f"  … rate limited, retrying in {delay:.0f}s")
+        # An idle keep-alive socket rarely survives the wait, and a sent
+        # POST is never resent, so start the retry on a fresh connection
+        _close_connection()
+        time.sleep(delay)
+
+    try:
+        data = json.loads(raw) if raw else None
+    except ValueError:
+        data = None  # e.g. the HTML page behind a 502 or 504
+    return status, response_headers, data
+
+
+def _gh_call(method, path, payload=None):
+    """Run a GitHub API request and return its data, or None on error."""
+    status, _, data = github_request(method, path, payload)
+    if status >= 400:
+        message = data.get("message") if isinstance(data, dict) else data or ""
+        print(f"Error: {method} {path} -> {status} {message}")
+        return None
+    return data if data is not None else {}
+
+
+def gh_get(path):
+    return _gh_call("GET", path)
+
+
+def gh_post(path, payload):
+    return _gh_call("POST", path, payload)
+
+
+def gh_patch(path, payload):
+    return _gh_call("PATCH", path, payload)
+
+
+def gh_put(path, payload):
+    return _gh_call("PUT", path, payload)
+
+
+def _parse_links(link_header):
+    """Map each rel of a Link header (next, last, ...) to its URL."""
+    links = {}
+    for part in link_header.split(","):
+        url, _, rel = part.partition(";")
+        rel = rel.strip()
+        if rel.startswith('rel="'):
+            links[rel[5:-1]] = urlsplit(url.strip(" <>"))
+    return links
+
+
+def paginated_get(path):
+    """Return every item of a paginated GitHub list endpoint, or None on error.
+
+    The first page's Link header gives the last page number, so the
+    remaining pages are fetched in parallel and then joined in order. Any
+    failed page fails the whole listing, so a partial list is never
+    mistaken for a complete one.
+    """
+    separator = "&" if "?" in path else "?"
+    first_path = f"{path}{separator}per_page=100"
+    status, headers, data = github_request("GET", first_path)
+    if status >= 400:
+        print(f"Error: GET {first_path} -> {status}")
+        return None
+    items = list(data)
+
+    links = _parse_links(headers.get("Link", ""))
+    if "last" in links:
+        last_page = int(parse_qs(links["last"].query)["page"][0])
+        futures = [
+            worker_pool.submit(gh_get, f"{first_path}&page={page}")
+            for page in range(2, last_page + 1)
+        ]
+        pages = [future.result() for future in futures]
+        if any(page is None for page in pages):
+            return None
+        for page in pages:
+            items.extend(page)
+        return items
+
+    # No page count given: fall back to following rel="next"
+    while "next" in links:
+        next_path = f"{links['next'].path}?{links['next'].query}"
+        status, headers, data = github_request("GET", next_path)
+        if status >= 400:
+            print(f"Error: GET {next_path} -> {status}")
+            return None
+        items.extend(data)
+        links = _parse_links(headers.get("Link", ""))
+    return items
+
+
+def graphql(query, variables=None):
+    """Run a GraphQL query and return its data, or None on error."""
+    result = gh_post("/graphql", {"query": query, "variables": variables or {}})
+    if result is None:
+        return None
+    for error in result.get("errors", []):
+        print(f"Error: {error.get('message')}")
+    return result.get("data")
+
+
+# Repository node id and one page of its labels
+REPO_INFO_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id name }
+    }
+  }
+}
+"""
+
+_repo_info = None
+
+
+def get_repo_info():
+    """Return the repository node id and a label name -> node id map."""
+    global _repo_info
+    if _repo_info is None:
+        labels = {}
+        variables = {"owner": REPO_OWNER, "name": REPO_NAME, "cursor": None}
+        while True:
+            data = graphql(REPO_INFO_QUERY, variables)
+            if not data:
+                print(f"Error: could not resolve repository {REPO}")
+                sys.exit(1)
+            repo = data["repository"]
+            page = repo["labels"]
+            labels.update((l["name"], l["id"]) for l in page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            variables["cursor"] = page["pageInfo"]["endCursor"]
+        _repo_info = (repo["id"], labels)
+    return _repo_info
+
+
+def chunks(items, size):
+    """Yield successive slices of `items` holding at most `size` elements."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def create_issue_batch(issues):
+    """Create several issues with one aliased createIssue mutation.
+
+    issues is a list of (item_id, title, body, labels) tuples. Returns a
+    list of (item_id, issue_number) pairs for the issues that were created.
+    """
+    repo_id, label_ids = get_repo_info()
+    params = ["$repo: ID!"]
+    fields = []
+    variables = {"repo": repo_id}
+    for i, (item_id, title, body, labels) in enumerate(issues):
+        missing = [l for l in labels if l not in label_ids]
+        if missing:
+            print(f"  ⚠ {item_id}: unknown labels {', '.join(missing)} (run 'labels' first)")
+        params.append(f"$t{i}: String!, $b{i}: String, $l{i}: [ID!]")
+        fields.append(
+            f"i{i}: createIssue(input: {{repositoryId: $repo, title: $t{i}, "
+            f"body: $b{i}, labelIds: $l{i}}}) {{ issue {{ number }} }}"
+        )
+        variables[f"t{i}"] = title
+        variables[f"b{i}"] = body
+        variables[f"l{i}"] = [label_ids[l] for l in labels if l in label_ids]
+
+    data = graphql(f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}", variables)
+    if not data:
+        return []
+
+    created = []
+    for i, (item_id, *_) in enumerate(issues):
+        result = data.get(f"i{i}")
+        if result:
+            created.append((item_id, result["issue"]["number"]))
+    return created
 
 
 def create_labels():
     """Create labels for the project."""
+    print("Creating labels...")
+    _send_concurrently(_label_requests())
+
+
+def create_milestones():
+    """Create milestones for each Epic."""
+    print("\nCreating milestones...")
+    _send_concurrently(_milestone_requests())
+
+
+def create_labels_and_milestones():
+    """Create labels and milestones together in one concurrent round."""
+    print("Creating labels...")
+    requests = _label_requests()
+    print("\nCreating milestones...")
+    requests += _milestone_requests()
+    if requests:
+        print(f"\nSending {len(requests)} label/milestone changes...")
+    _send_concurrently(requests)
+
+
+def _send_concurrently(requests):
+    """Send (name, method, path, payload) calls on the worker pool and report each.
+
+    _send() keeps at most MAX_CONCURRENT_REQUESTS of them in flight at once.
+    """
+    results = worker_pool.map(lambda request: _gh_call(*request[1:]), requests)
+    for (name, *_), result in zip(requests, results):
+        if result is not None:
+            print(f"  ✓ {name}")
+
+
+def _label_requests():
+    """Return the calls needed to create or update the project labels."""
     labels = [
         # Epic labels
         ("epic:E1", "Epic 1: Project Setup", "7057ff"),
@@ -63,46 +602,91 @@ def create_labels():
         ("status:done", "Completed", "0e8a16"),
     ]
 
-    print("Creating labels...")
-    for name, description, color in labels:
-        result = run_gh_command([
-            "label", "create", name,
-            "--repo", REPO,
-            "--description", description,
-            "--color", color,
-            "--force"
-        ])
-        if result is not None:
-            print(f"  ✓ {name}")
-        time.sleep(0.5)
-
+    listed = paginated_get(f"/repos/{REPO}/labels")
+    if listed is None:
+        print("Error: could not list the existing labels; skipping labels")
+        return []
+    existing = {
+        label["name"]: (label["description"] or "", label["color"].lower())
+        for label in listed
+    }
 
-def create_milestones():
-    """Create milestones for each Epic."""
-    conn = sqlite3.connect(DB_PATH)
+    requests = []
+    for name, description, color in labels:
+        if existing.get(name) == (description, color):
+            print(f"  = {name} (unchanged)")
+            continue
+        payload = {"name": name, "description": description, "color": color}
+        if name in existing:
+            requests.append((name, "PATCH", f"/repos/{REPO}/labels/{quote(name, safe='')}", payload))
+        else:
+            requests.append((name, "POST", f"/repos/{REPO}/labels", payload))
+    return requests
+
+
+def _milestone_requests():
+    """Return the calls needed to create the missing Epic milestones."""
+    conn = get_conn()
     cursor = conn.cursor()
 
     cursor.execute("SELECT id, title, description FROM epics ORDER BY id")
     epics = cursor.fetchall()
 
-    print("\nCreating milestones...")
+    listed = paginated_get(f"/repos/{REPO}/milestones?state=all")
+    if listed is None:
+        print("Error: could not list the existing milestones; skipping milestones")
+        return []
+    existing = {milestone["title"] for milestone in listed}
+
+    requests = []
     for epic_id, title, description in epics:
-        result = run_gh_command([
-            "api", f"repos/{REPO}/milestones",
-            "-X", "POST",
-            "-f", f"title={epic_id}: {title}",
-            "-f", f"description={description or ''}"
-        ])
-        if result:
-            print(f"  ✓ {epic_id}: {title}")
-        time.sleep(0.5)
+        milestone_title = f"{epic_id}: {title}"
+        if milestone_title in existing:
+            print(f"  = {milestone_title} (exists)")
+            continue
+        requests.append((milestone_title, "POST", f"/repos/{REPO}/milestones", {
+            "title": milestone_title,
+            "description": description or "",
+        }))
+    return requests
+
+
+def _flush_issue_numbers(conn, table, updates):
+    """Write buffered (issue_number, id) pairs and commit.
+
+    Rows that already have an issue number are left alone, so a re-run can
+    never overwrite the number recorded by an earlier run.
+    """
+    if updates:
+        conn.executemany(
+            f"UPDATE {table} SET github_issue_number = ? "
+            "WHERE id = ? AND github_issue_number IS NULL",
+            updates
+        )
+    conn.commit()
+    updates.clear()
 
-    conn.close()
+
+def existing_issues():
+    """Map the title of every issue in the repository to its number.
+
+    Returns None when the issues could not all be listed: creating issues
+    against a partial list would duplicate the ones it missed.
+    """
+    listed = paginated_get(f"/repos/{REPO}/issues?state=all")
+    if listed is None:
+        print("Error: could not list the existing issues; no issues created")
+        return None
+    return {
+        issue["title"]: issue["number"]
+        for issue in listed
+        if "pull_request" not in issue
+    }
 
 
 def create_epic_issues():
     """Create GitHub Issues for each Epic."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -112,163 +696,161 @@ def create_epic_issues():
         FROM epics e
         LEFT JOIN stories s ON s.epic_id = e.id
         LEFT JOIN tasks t ON t.story_id = s.id
+        WHERE e.github_issue_number IS NULL
         GROUP BY e.id
         ORDER BY e.id
     """)
     epics = cursor.fetchall()
 
     print("\nCreating Epic issues...")
+    existing = existing_issues() if epics else {}
+    if existing is None:
+        return
+    titles = {}
+    pending = []
+    updates = []
     for epic in epics:
-        epic_id, title, description, priority, stories, tasks = epic
-
-        body = f"""# {title}
-
-## Description
-{description or 'No description'}
-
-## Scope
-- Stories: {stories}
-- Tasks: {tasks}
-
-## Progress
-Track progress in the implementation tracker:
-```bash
-python scripts/tracker.py show {epic_id}
-```
-
----
-*This issue tracks the overall Epic. Individual tasks have their own issues.*
+        epic_id, title = epic["id"], epic["title"]
+
+        issue_title = f"[{epic_id}] {title}"
+        if issue_title in existing:
+            # Created by an earlier run that never stored the number
+            updates.append((existing[issue_title], epic_id))
+            print(f"  = {epic_id}: already exists as #{existing[issue_title]}")
+            continue
+
+        body = EPIC_BODY_TEMPLATE.format_map({
+            "title": title,
+            "description": epic["description"] or "No description",
+            "stories": epic["stories"],
+            "tasks": epic["tasks"],
+            "epic_id": epic_id,
+        })
+        labels = ["type:epic", f"epic:{epic_id}", PRIORITY_LABELS[epic["priority"]]]
+
+        titles[epic_id] = title
+        pending.append((epic_id, issue_title, body, labels))
+
+    # Take the write lock before creating anything, so the issue numbers
+    # can always be stored; the whole phase is one transaction
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for batch in chunks(pending, GRAPHQL_BATCH_SIZE):
+            for epic_id, issue_number in create_issue_batch(batch):
+                updates.append((issue_number, epic_id))
+                print(f"  ✓ {epic_id}: {titles[epic_id]} -> #{issue_number}")
+    finally:
+        # Keep the numbers of issues already created, even when interrupted
+        _flush_issue_numbers(conn, "epics", updates)
+
+
+# Tasks still without an issue. A NULL :epic disables the epic filter and
+# a negative :limit means no limit, so the SQL text (and the statement
+# SQLite caches for it) is the same for every call.
+TASK_SQL = """
+    SELECT t.id, t.title, t.description, t.estimated_hours,
+           s.id as story_id, s.title as story_title,
+           e.id as epic_id, e.title as epic_title, e.priority
+    FROM tasks t
+    JOIN stories s ON t.story_id = s.id
+    JOIN epics e ON s.epic_id = e.id
+    WHERE t.github_issue_number IS NULL
+      AND (:epic IS NULL OR e.id = :epic)
+    ORDER BY t.id
+    LIMIT :limit
 """
 
-        labels = [
-            "type:epic",
-            f"epic:{epic_id}",
-            f"priority:{priority.lower()}"
-        ]
+# How many rows TASK_SQL returns, for the progress message
+TASK_COUNT_SQL = f"SELECT COUNT(*) FROM ({TASK_SQL})"
 
-        result = run_gh_command([
-            "issue", "create",
-            "--repo", REPO,
-            "--title", f"[{epic_id}] {title}",
-            "--body", body,
-            "--label", ",".join(labels)
-        ])
 
-        if result:
-            # Extract issue number and update database
-            issue_url = result
-            issue_number = issue_url.split('/')[-1]
-            cursor.execute(
-                "UPDATE epics SET github_issue_number = ? WHERE id = ?",
-                (issue_number, epic_id)
-            )
-            conn.commit()
-            print(f"  ✓ {epic_id}: {title} -> #{issue_number}")
-
-        time.sleep(DELAY_BETWEEN_ISSUES)
-
-    conn.close()
+def subtask_titles(conn, task_ids):
+    """Map each of the given task ids to its subtask titles, in one query."""
+    rows = conn.execute(f"""
+        SELECT task_id, title FROM subtasks
+        WHERE task_id IN ({",".join("?" * len(task_ids))})
+        ORDER BY task_id, id
+    """, task_ids)
+    return {
+        task_id: [row["title"] for row in group]
+        for task_id, group in itertools.groupby(rows, key=lambda row: row["task_id"])
+    }
 
 
 def create_task_issues(epic_filter=None, limit=None):
     """Create GitHub Issues for tasks."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    query = """
-        SELECT t.id, t.title, t.description, t.estimated_hours,
-               s.id as story_id, s.title as story_title,
-               e.id as epic_id, e.title as epic_title, e.priority
-        FROM tasks t
-        JOIN stories s ON t.story_id = s.id
-        JOIN epics e ON s.epic_id = e.id
-        WHERE t.github_issue_number IS NULL
-    """
-    params = []
-
-    if epic_filter:
-        query += " AND e.id = ?"
-        params.append(epic_filter)
-
-    query += " ORDER BY t.id"
-
-    if limit:
-        query += f" LIMIT {limit}"
-
-    cursor.execute(query, params)
-    tasks = cursor.fetchall()
-
-    print(f"\nCreating {len(tasks)} task issues...")
-
-    created = 0
-    for task in tasks:
-        task_id, title, description, hours, story_id, story_title, epic_id, epic_title, priority = task
-
-        # Get subtasks
-        cursor.execute("SELECT title FROM subtasks WHERE task_id = ? ORDER BY id", (task_id,))
-        subtasks = [row[0] for row in cursor.fetchall()]
-
-        subtask_list = "\n".join([f"- [ ] {st}" for st in subtasks]) if subtasks else "No subtasks defined"
-
-        body = f"""## {title}
-
-**Epic:** {epic_id} - {epic_title}
-**Story:** {story_id} - {story_title}
-**Estimated:** {hours or 'TBD'} hours
-
-### Description
-{description or 'See detailed implementation plan.'}
-
-### Subtasks
-{subtask_list}
-
-### Tracker
-```bash
-# Start working on this task
-python scripts/tracker.py start {task_id}
-
-# Mark as complete
-python scripts/tracker.py done {task_id}
-```
-
----
-*See IMPLEMENTATION_PLAN_DETAILED.md for full technical details.*
-"""
-
-        labels = [
-            "type:task",
-            f"epic:{epic_id}",
-            f"priority:{priority.lower()}"
-        ]
-
-        result = run_gh_command([
-            "issue", "create",
-            "--repo", REPO,
-            "--title", f"[{task_id}] {title}",
-            "--body", body,
-            "--label", ",".join(labels)
-        ])
-
-        if result:
-            issue_url = result
-            issue_number = issue_url.split('/')[-1]
-            cursor.execute(
-                "UPDATE tasks SET github_issue_number = ? WHERE id = ?",
-                (issue_number, task_id)
-            )
-            conn.commit()
-            print(f"  ✓ {task_id}: {title[:40]}... -> #{issue_number}")
-            created += 1
-
-        time.sleep(DELAY_BETWEEN_ISSUES)
+    conn = get_conn()
+    params = {"epic": epic_filter or None, "limit": limit or -1}
+    count = conn.execute(TASK_COUNT_SQL, params).fetchone()[0]
+    cursor = conn.execute(TASK_SQL, params)
+
+    print(f"\nCreating {count} task issues...")
+    existing = None
+    titles = {}
+    pending = []
+    updates = []
+    while chunk := cursor.fetchmany(DB_FETCH_SIZE):
+        if existing is None:
+            existing = existing_issues()
+            if existing is None:
+                return
+        subtasks_by_task = subtask_titles(conn, [task["id"] for task in chunk])
+
+        for task in chunk:
+            task_id, title = task["id"], task["title"]
+
+            issue_title = f"[{task_id}] {title}"
+            if issue_title in existing:
+                # Created by an earlier run that never stored the number
+                updates.append((existing[issue_title], task_id))
+                print(f"  = {task_id}: already exists as #{existing[issue_title]}")
+                continue
+
+            subtasks = subtasks_by_task.get(task_id, [])
+
+            subtask_list = "\n".join([f"- [ ] {st}" for st in subtasks]) if subtasks else "No subtasks defined"
+
+            body = TASK_BODY_TEMPLATE.format_map({
+                "title": title,
+                "epic_id": task["epic_id"],
+                "epic_title": task["epic_title"],
+                "story_id": task["story_id"],
+                "story_title": task["story_title"],
+                "hours": task["estimated_hours"] or "TBD",
+                "description": task["description"] or "See detailed implementation plan.",
+                "subtask_list": subtask_list,
+                "task_id": task_id,
+            })
+            labels = ["type:task", f"epic:{task['epic_id']}", PRIORITY_LABELS[task["priority"]]]
+
+            titles[task_id] = title
+            pending.append((task_id, issue_title, body, labels))
+
+    # Batches are created in parallel; only this thread touches the database
+    get_repo_info()
+    futures = [
+        worker_pool.submit(create_issue_batch, batch)
+        for batch in chunks(pending, GRAPHQL_BATCH_SIZE)
+    ]
+    created_count = 0
+    try:
+        for future in as_completed(futures):
+            for task_id, issue_number in future.result():
+                updates.append((issue_number, task_id))
+                print(f"  ✓ {task_id}: {titles[task_id][:40]}... -> #{issue_number}")
+                created_count += 1
+            if len(updates) >= DB_FLUSH_SIZE:
+                _flush_issue_numbers(conn, "tasks", updates)
+    finally:
+        # Keep the numbers of issues already created, even when interrupted
+        _flush_issue_numbers(conn, "tasks", updates)
 
-    print(f"\nCreated {created} issues")
-    conn.close()
+    print(f"\nCreated {created_count} issues")
 
 
 def sync_status():
     """Sync status between database and GitHub Issues."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     cursor = conn.cursor()
 
     # Get tasks with GitHub issue numbers
@@ -281,55 +863,53 @@ def sync_status():
 
     print(f"Syncing {len(tasks)} tasks...")
 
+    # Read every task issue up front instead of one GET per task; issues
+    # missing from the listing (or all of them, if it failed) are fetched singly
+    listed = paginated_get(f"/repos/{REPO}/issues?state=all&labels=type:task")
+    issues = {issue["number"]: issue for issue in listed or []}
+
+    futures = []
     for task_id, status, issue_number in tasks:
-        # Remove old status labels and add new one
-        status_label = f"status:{status.lower().replace('_', '-')}"
+        issue = issues.get(issue_number) or gh_get(f"/repos/{REPO}/issues/{issue_number}")
+        if not issue:
+            continue
 
-        # Get current labels
-        result = run_gh_command([
-            "issue", "view", str(issue_number),
-            "--repo", REPO,
-            "--json", "labels"
-        ])
+        # Replace any old status label with the current one
+        current_labels = [l["name"] for l in issue.get("labels", [])]
+        labels = [l for l in current_labels if not l.startswith("status:")]
+        labels.append(f"status:{status.lower().replace('_', '-')}")
+        if labels == current_labels:
+            labels = None
 
-        if result:
-            current = json.loads(result)
-            current_labels = [l["name"] for l in current.get("labels", [])]
-
-            # Remove old status labels
-            for label in current_labels:
-                if label.startswith("status:"):
-                    run_gh_command([
-                        "issue", "edit", str(issue_number),
-                        "--repo", REPO,
-                        "--remove-label", label
-                    ])
-
-            # Add new status label
-            run_gh_command([
-                "issue", "edit", str(issue_number),
-                "--repo", REPO,
-                "--add-label", status_label
-            ])
-
-            # Close if done
-            if status == "DONE":
-                run_gh_command([
-                    "issue", "close", str(issue_number),
-                    "--repo", REPO
-                ])
+        # Close if done
+        close = status == "DONE" and issue.get("state") != "closed"
 
+        futures.append((task_id, status, worker_pool.submit(_sync_issue, issue_number, labels, close)))
+
+    for task_id, status, future in futures:
+        if future.result():
             print(f"  ✓ {task_id} -> {status}")
 
-        time.sleep(0.5)
 
-    conn.close()
+def _sync_issue(issue_number, labels, close):
+    """Set an issue's full label set in one call and close it if needed."""
+    issue_path = f"/repos/{REPO}/issues/{issue_number}"
+    if labels is not None and gh_put(f"{issue_path}/labels", {"labels": labels}) is None:
+        return False
+    if close and gh_patch(issue_path, {"state": "closed"}) is None:
+        return False
+    return True
 
 
 def main():
     import argparse
 
-    parser = argparse.ArgumentParser(description='Create GitHub Issues from tracker')
+    parser = argparse.ArgumentParser(
+        description='Create GitHub Issues from tracker',
+        epilog='Authentication: uses $GITHUB_TOKEN (or $GH_TOKEN) when set, '
+               'otherwise the token from "gh auth token". Set $GH_TOKENS to a '
+               'comma-separated list to rotate requests across several tokens.'
+    )
     parser.add_argument('command', choices=['labels', 'milestones', 'epics', 'tasks', 'sync', 'all'],
                        help='What to create')
     parser.add_argument('--epic', '-e', help='Only create tasks for specific epic (e.g., E1)')
@@ -348,8 +928,7 @@ def main():
     elif args.command == 'sync':
         sync_status()
     elif args.command == 'all':
-        create_labels()
-        create_milestones()
+        create_labels_and_milestones()
         create_epic_issues()
         print("\n⚠️  Task issues not created automatically.")
         print("Run: python scripts/create_github_issues.py tasks --epic E1")
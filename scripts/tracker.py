@@ -4,13 +4,16 @@ Implementation Tracker CLI
 Query and update task status in the tracker database.
 """
 
+import atexit
+import functools
+import io
+import os
+import re
 import sqlite3
 import sys
-import argparse
-from datetime import datetime
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent.parent / "implementation_tracker.db"
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "implementation_tracker.db")
 
 # ANSI colors
 class Colors:
@@ -23,6 +26,17 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
 
+# Piped or redirected output: no ANSI escapes
+PLAIN = not sys.stdout.isatty()
+if PLAIN:
+    for _name in [name for name in vars(Colors) if not name.startswith('_')]:
+        setattr(Colors, _name, '')
+
+# Title format specs: truncate and pad in one go for the terminal, full titles when plain
+EPIC_TITLE_FMT = '' if PLAIN else '<40.40'
+WORK_TITLE_FMT = '' if PLAIN else '.50'
+LIST_TITLE_FMT = '' if PLAIN else '<60.60'
+
 STATUS_COLORS = {
     'BACKLOG': Colors.WHITE,
     'TODO': Colors.BLUE,
@@ -37,14 +51,78 @@ STATUS_ICONS = {
     'DONE': '✅',
 }
 
+# Icon and color escape that start each item line, built once per status
+STATUS_PREFIX = {status: f"{STATUS_ICONS[status]} {STATUS_COLORS[status]}" for status in STATUS_ICONS}
+UNKNOWN_PREFIX = f"? {Colors.NC}"
+
+# Item type -> table, and each table's parent column
+TABLE_FOR_TYPE = {
+    'epic': 'epics',
+    'story': 'stories',
+    'task': 'tasks',
+    'subtask': 'subtasks',
+}
+TYPE_SINGULAR = {table: item_type for item_type, table in TABLE_FOR_TYPE.items()}
+PARENT_COL = {
+    'stories': 'epic_id',
+    'tasks': 'story_id',
+    'subtasks': 'task_id',
+}
+
+# Item IDs: E1 = epic, S1.1 = story, T1.1.1 = task (2 dots), T1.1.1.1 = subtask (3 dots)
+_ID_RE = re.compile(r'^([EST])(\d+(?:\.\d+)*)$')
+TABLE_FOR_PREFIX = {'E': 'epics', 'S': 'stories', 'T': 'tasks'}
+
+# Status update per table: one statement that stamps started_at the first time an item
+# goes IN_PROGRESS and completed_at on DONE. It only applies while the item still has
+# the status it was read with (:old), so no explicit transaction is needed to report
+# the status it replaced. Subtasks have no started_at column.
+UPDATE_SQL = {
+    table: f"""
+        UPDATE {table} SET
+            status = :status,
+            started_at = CASE WHEN :status = 'IN_PROGRESS' AND started_at IS NULL
+                              THEN :now ELSE started_at END,
+            completed_at = CASE WHEN :status = 'DONE' THEN :now ELSE completed_at END
+        WHERE id = :id AND status = :old
+    """
+    for table in ('epics', 'stories', 'tasks')
+}
+UPDATE_SQL['subtasks'] = """
+    UPDATE subtasks SET
+        status = :status,
+        completed_at = CASE WHEN :status = 'DONE' THEN :now ELSE completed_at END
+    WHERE id = :id AND status = :old
+"""
+
+# Title and current status of one item, read before updating it
+ITEM_SQL = {table: f"SELECT title, status FROM {table} WHERE id = ?" for table in UPDATE_SQL}
 
+
+def table_for_id(item_id):
+    """Return the table an item ID belongs to, or None for a malformed ID."""
+    m = _ID_RE.match(item_id)
+    if not m:
+        return None
+    prefix, number = m.groups()
+    if prefix == 'E':
+        return 'epics' if '.' not in number else None
+    if prefix == 'T' and number.count('.') >= 3:
+        return 'subtasks'
+    return TABLE_FOR_PREFIX[prefix]
+
+
+@functools.lru_cache(maxsize=1)
 def get_connection():
-    """Get database connection."""
-    if not DB_PATH.exists():
+    """Get database connection, opened once and shared for the whole process."""
+    if not os.path.exists(DB_PATH):
         print(f"{Colors.RED}Error: Database not found at {DB_PATH}{Colors.NC}")
         print(f"Run: python scripts/create_tracker_db.py")
         sys.exit(1)
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    atexit.register(conn.close)
+    return conn
 
 
 def show_progress():
@@ -56,50 +134,45 @@ def show_progress():
     cursor.execute("SELECT * FROM overall_progress")
     p = cursor.fetchone()
 
-    task_pct = p[8] if p[8] else 0
+    task_pct = p['progress_pct'] or 0
     filled = int(task_pct / 5)
     bar = '█' * filled + '░' * (20 - filled)
 
-    print(f"""
+    # Collect the dashboard and write it in one go
+    out = [f"""
 {Colors.CYAN}╔══════════════════════════════════════════════════════════════════════════╗
 ║           ProjectsManagerWebV2 - Implementation Progress                   ║
 ╠══════════════════════════════════════════════════════════════════════════╣{Colors.NC}
-║  Overall: [{Colors.GREEN}{bar}{Colors.NC}] {task_pct:.1f}% ({p[5]}/{p[4]} tasks)
+║  Overall: [{Colors.GREEN}{bar}{Colors.NC}] {task_pct:.1f}% ({p['done_tasks']}/{p['total_tasks']} tasks)
 ╠══════════════════════════════════════════════════════════════════════════╣
-║  EPICS:                                                                    ║""")
+║  EPICS:                                                                    ║"""]
 
     # Epic progress
     cursor.execute("SELECT * FROM epic_progress")
     epics = cursor.fetchall()
 
     for epic in epics:
-        id, title, status, priority, total_stories, done_stories, total_tasks, done_tasks, pct = epic
-        icon = STATUS_ICONS.get(status, '?')
-        color = STATUS_COLORS.get(status, Colors.NC)
-        pct_str = f"{pct:.0f}%" if pct else "0%"
+        status = epic['status']
+        prefix = STATUS_PREFIX.get(status, UNKNOWN_PREFIX)
+        pct_str = f"{epic['progress_pct']:.0f}%" if epic['progress_pct'] else "0%"
 
-        # Truncate title
-        title_display = title[:40] if len(title) > 40 else title
-        print(f"║  {icon} {color}{id}: {title_display:<40}{Colors.NC} [{status}] {pct_str:>4}")
+        out.append(f"║  {prefix}{epic['id']}: {epic['title']:{EPIC_TITLE_FMT}}{Colors.NC} [{status}] {pct_str:>4}")
 
-    print(f"{Colors.CYAN}╠══════════════════════════════════════════════════════════════════════════╣{Colors.NC}")
+    out.append(f"{Colors.CYAN}╠══════════════════════════════════════════════════════════════════════════╣{Colors.NC}")
 
     # Current work
     cursor.execute("SELECT * FROM current_work")
     current = cursor.fetchall()
 
     if current:
-        print("║  CURRENT WORK:                                                             ║")
+        out.append("║  CURRENT WORK:                                                             ║")
         for item in current[:3]:
-            type, id, title, status, parent, epic, hours = item
-            title_short = title[:50] if len(title) > 50 else title
-            print(f"║  📋 {id}: {title_short}")
+            out.append(f"║  📋 {item['id']}: {item['title']:{WORK_TITLE_FMT}}")
     else:
-        print("║  No tasks currently in progress                                            ║")
+        out.append("║  No tasks currently in progress                                            ║")
 
-    print(f"{Colors.CYAN}╚══════════════════════════════════════════════════════════════════════════╝{Colors.NC}")
-
-    conn.close()
+    out.append(f"{Colors.CYAN}╚══════════════════════════════════════════════════════════════════════════╝{Colors.NC}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def list_items(item_type, parent_id=None, status_filter=None):
@@ -107,14 +180,10 @@ def list_items(item_type, parent_id=None, status_filter=None):
     conn = get_connection()
     cursor = conn.cursor()
 
-    table = item_type + 's'  # epics, stories, tasks, subtasks
-    parent_col = {
-        'stories': 'epic_id',
-        'tasks': 'story_id',
-        'subtasks': 'task_id',
-    }.get(table)
+    table = TABLE_FOR_TYPE[item_type]
+    parent_col = PARENT_COL.get(table)
 
-    query = f"SELECT id, title, status, priority FROM {table}"
+    query = f"SELECT id, title, status FROM {table}"
     params = []
 
     conditions = []
@@ -137,13 +206,11 @@ def list_items(item_type, parent_id=None, status_filter=None):
     print("-" * 80)
 
     for item in items:
-        id, title, status, priority = item[:4]
-        icon = STATUS_ICONS.get(status, '?')
-        color = STATUS_COLORS.get(status, Colors.NC)
-        print(f"{icon} {color}{id:<10}{Colors.NC} {title[:60]:<60} [{status}]")
+        status = item['status']
+        print(f"{STATUS_PREFIX.get(status, UNKNOWN_PREFIX)}{item['id']:<10}{Colors.NC} "
+              f"{item['title']:{LIST_TITLE_FMT}} [{status}]")
 
     print(f"\nTotal: {len(items)} {table}")
-    conn.close()
 
 
 def update_status(item_id, new_status):
@@ -151,52 +218,31 @@ def update_status(item_id, new_status):
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Determine table from ID prefix
-    # E1 = epic, S1.1 = story, T1.1.1 = task (2 dots), T1.1.1.1 = subtask (3 dots)
-    if item_id.startswith('E') and '.' not in item_id:
-        table = 'epics'
-    elif item_id.startswith('S'):
-        table = 'stories'
-    elif item_id.count('.') >= 3:
-        table = 'subtasks'
-    elif item_id.startswith('T'):
-        table = 'tasks'
-    else:
+    table = table_for_id(item_id)
+    if not table:
         print(f"{Colors.RED}Cannot determine item type from ID: {item_id}{Colors.NC}")
         return
 
-    # Get current status
-    cursor.execute(f"SELECT title, status FROM {table} WHERE id = ?", (item_id,))
-    result = cursor.fetchone()
-
-    if not result:
-        print(f"{Colors.RED}Item not found: {item_id}{Colors.NC}")
-        return
+    from datetime import datetime
 
-    old_status = result[1]
-    title = result[0]
-
-    if old_status == new_status:
-        print(f"Status already {new_status}")
-        return
-
-    # Update status
     now = datetime.now().isoformat()
-    if new_status == 'IN_PROGRESS' and old_status == 'BACKLOG':
-        cursor.execute(f"UPDATE {table} SET status = ?, started_at = ? WHERE id = ?",
-                      (new_status, now, item_id))
-    elif new_status == 'DONE':
-        cursor.execute(f"UPDATE {table} SET status = ?, completed_at = ? WHERE id = ?",
-                      (new_status, now, item_id))
-    else:
-        cursor.execute(f"UPDATE {table} SET status = ? WHERE id = ?",
-                      (new_status, item_id))
-
-    conn.commit()
-    conn.close()
-
-    print(f"{Colors.GREEN}✓ Updated {item_id}: {old_status} → {new_status}{Colors.NC}")
-    print(f"  {title}")
+    while True:
+        item = cursor.execute(ITEM_SQL[table], (item_id,)).fetchone()
+        if not item:
+            print(f"{Colors.RED}Item not found: {item_id}{Colors.NC}")
+            return
+        if item['status'] == new_status:
+            print(f"Status already {new_status}")
+            return
+        cursor.execute(UPDATE_SQL[table],
+                       {'status': new_status, 'old': item['status'], 'now': now, 'id': item_id})
+        conn.commit()
+        if cursor.rowcount:
+            break
+        # The status changed since it was read: read it again
+
+    print(f"{Colors.GREEN}✓ Updated {item_id}: {item['status']} → {new_status}{Colors.NC}")
+    print(f"  {item['title']}")
 
 
 def start_task(task_id):
@@ -230,26 +276,25 @@ def show_task(task_id):
         print(f"{Colors.RED}Task not found: {task_id}{Colors.NC}")
         return
 
-    id, title, desc, status, est_hrs, act_hrs, started, completed, story, epic = task
-
-    icon = STATUS_ICONS.get(status, '?')
+    status = task['status']
+    prefix = STATUS_PREFIX.get(status, UNKNOWN_PREFIX)
     color = STATUS_COLORS.get(status, Colors.NC)
 
     print(f"""
 {Colors.CYAN}{'='*80}{Colors.NC}
-{icon} {color}{id}{Colors.NC}: {title}
+{prefix}{task['id']}{Colors.NC}: {task['title']}
 {Colors.CYAN}{'='*80}{Colors.NC}
 
 Status:      {color}{status}{Colors.NC}
-Epic:        {epic}
-Story:       {story}
-Estimated:   {est_hrs or 'N/A'} hours
-Actual:      {act_hrs or 'N/A'} hours
-Started:     {started or 'Not started'}
-Completed:   {completed or 'Not completed'}
+Epic:        {task['epic_title']}
+Story:       {task['story_title']}
+Estimated:   {task['estimated_hours'] or 'N/A'} hours
+Actual:      {task['actual_hours'] or 'N/A'} hours
+Started:     {task['started_at'] or 'Not started'}
+Completed:   {task['completed_at'] or 'Not completed'}
 
 Description:
-{desc or 'No description'}
+{task['description'] or 'No description'}
 """)
 
     # Get subtasks
@@ -261,20 +306,18 @@ Description:
     if subtasks:
         print(f"\n{Colors.CYAN}Subtasks:{Colors.NC}")
         for st in subtasks:
-            st_icon = STATUS_ICONS.get(st[2], '?')
-            st_color = STATUS_COLORS.get(st[2], Colors.NC)
-            print(f"  {st_icon} {st_color}{st[0]}{Colors.NC}: {st[1]}")
-
-    conn.close()
+            print(f"  {STATUS_PREFIX.get(st['status'], UNKNOWN_PREFIX)}{st['id']}{Colors.NC}: {st['title']}")
 
 
 def export_for_github():
     """Export tasks in a format for GitHub Issues creation."""
+    from datetime import datetime
+
     conn = get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
-        SELECT t.id, t.title, t.description, t.estimated_hours,
+        SELECT t.id, t.title, t.estimated_hours,
                s.id as story_id, s.title as story_title,
                e.id as epic_id, e.title as epic_title
         FROM tasks t
@@ -282,29 +325,48 @@ def export_for_github():
         JOIN epics e ON s.epic_id = e.id
         ORDER BY t.id
     """)
-    tasks = cursor.fetchall()
-
-    print("# GitHub Issues Export")
-    print(f"# Generated: {datetime.now().isoformat()}")
-    print(f"# Total tasks: {len(tasks)}")
-    print()
 
-    for task in tasks:
-        id, title, desc, hours, story_id, story_title, epic_id, epic_title = task
-        labels = f"epic:{epic_id},story:{story_id}"
-        if hours:
-            labels += f",estimate:{hours}h"
+    # Stream rows from the cursor into one buffer; the header needs the final count
+    buf = io.StringIO()
+    count = 0
+    for task in cursor:
+        labels = f"epic:{task['epic_id']},story:{task['story_id']}"
+        if task['estimated_hours']:
+            labels += f",estimate:{task['estimated_hours']}h"
+
+        buf.write(f"## {task['id']}: {task['title']}\n"
+                  f"Labels: {labels}\n"
+                  f"Epic: {task['epic_title']}\n"
+                  f"Story: {task['story_title']}\n\n")
+        count += 1
+
+    sys.stdout.write("# GitHub Issues Export\n"
+                     f"# Generated: {datetime.now().isoformat()}\n"
+                     f"# Total tasks: {count}\n\n")
+    sys.stdout.write(buf.getvalue())
+
+
+# Subcommand -> handler taking the parsed arguments
+DISPATCH = {
+    'progress': lambda args: show_progress(),
+    'p': lambda args: show_progress(),
+    'list': lambda args: list_items(TYPE_SINGULAR[args.type], args.parent, args.status),
+    'show': lambda args: show_task(args.id),
+    'start': lambda args: start_task(args.id),
+    'done': lambda args: complete_task(args.id),
+    'update': lambda args: update_status(args.id, args.status),
+    'export': lambda args: export_for_github(),
+}
 
-        print(f"## {id}: {title}")
-        print(f"Labels: {labels}")
-        print(f"Epic: {epic_title}")
-        print(f"Story: {story_title}")
-        print()
 
-    conn.close()
+def main():
+    # The dashboard is the common case: skip building the parser for it
+    if sys.argv[1:] in ([], ['progress'], ['p']):
+        show_progress()
+        return
 
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description='Implementation Tracker CLI')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
@@ -340,20 +402,7 @@ def main():
 
     args = parser.parse_args()
 
-    if args.command in ['progress', 'p', None]:
-        show_progress()
-    elif args.command == 'list':
-        list_items(args.type[:-1], args.parent, args.status)  # Remove 's' from type
-    elif args.command == 'show':
-        show_task(args.id)
-    elif args.command == 'start':
-        start_task(args.id)
-    elif args.command == 'done':
-        complete_task(args.id)
-    elif args.command == 'update':
-        update_status(args.id, args.status)
-    elif args.command == 'export':
-        export_for_github()
+    DISPATCH[args.command or 'progress'](args)
 
 
 if __name__ == "__main__":
@@ -3,17 +3,93 @@
 Update GitHub Issues with detailed descriptions from implementation plan files.
 Parses IMPLEMENTATION_PLAN_DETAILED*.md files and updates both the database
 and GitHub issues with the full detailed content.
+GitHub is reached through the keep-alive API client in create_github_issues.py.
 """
 
+import hashlib
+import itertools
+import mmap
+import os
+import pickle
 import sqlite3
-import subprocess
 import re
 import sys
-import time
 from pathlib import Path
 
-DB_PATH = Path(__file__).parent.parent / "implementation_tracker.db"
-REPO = "eliahoco/ProjectsManagerWebV2"
+from create_github_issues import (
+    REPO_NAME,
+    REPO_OWNER,
+    chunks,
+    get_conn,
+    graphql,
+    subtask_titles,
+    worker_pool,
+)
+
+# Issues updated per GraphQL request (one aliased updateIssue each)
+GRAPHQL_BATCH_SIZE = 20
+
+# Issue bodies, filled in with str.format_map
+TASK_BODY_TEMPLATE = """## {title}
+
+**Epic:** {epic_id} - {epic_title}
+**Story:** {story_id} - {story_title}
+
+---
+
+{description}
+
+---
+
+### Subtasks Checklist
+{subtask_list}
+
+---
+
+### Tracker Commands
+```bash
+# Start working on this task
+python3 scripts/tracker.py start {task_id}
+
+# Mark as complete
+python3 scripts/tracker.py done {task_id}
+
+# Sync to GitHub
+python3 scripts/create_github_issues.py sync
+```
+
+---
+*See IMPLEMENTATION_PLAN_DETAILED*.md for full technical context.*
+"""
+
+EPIC_BODY_TEMPLATE = """# {title}
+
+## Overview
+{overview}
+
+## Scope
+- **Stories:** {stories}
+- **Tasks:** {tasks}
+- **Completed:** {done_tasks}
+- **Progress:** {progress}%
+
+## Stories in this Epic
+{stories_md}
+
+---
+
+### Progress Tracking
+```bash
+# View epic progress
+python3 scripts/tracker.py show {epic_id}
+
+# List all tasks
+python3 scripts/tracker.py list tasks --parent {first_story}
+```
+
+---
+*This issue tracks the overall Epic. Individual tasks have their own issues.*
+"""
 
 # Implementation plan files
 PLAN_FILES = [
@@ -23,318 +99,445 @@ PLAN_FILES = [
     Path(__file__).parent.parent / "IMPLEMENTATION_PLAN_DETAILED_PART4.md",
 ]
 
-def run_gh_command(args, input_text=None):
-    """Run a gh CLI command and return the result."""
-    cmd = ["gh"] + args
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            input=input_text
-        )
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
-            return None
-        return result.stdout.strip()
-    except FileNotFoundError:
-        print("Error: gh CLI not found. Install with: brew install gh")
-        sys.exit(1)
+# Parsed plan sections, reused while the plan files (and this script) are
+# unchanged
+PLAN_CACHE_PATH = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "pmwv2" / "plans.pkl"
 
 
-def parse_task_from_markdown(content, task_id):
-    """Parse a task's detailed content from markdown."""
-    # Pattern to find task section
-    # Match ### Task T1.1.1: Title or ### Task T1.1.1 - Title
-    pattern = rf"### Task {re.escape(task_id)}[:\-\s]+([^\n]+)\n(.*?)(?=\n### Task T|\n---\n### Task|\n## Story|\n# EPIC|\Z)"
-
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
-        return None
-
-    title = match.group(1).strip()
-    body = match.group(2).strip()
-
-    return {
-        "task_id": task_id,
-        "title": title,
-        "body": body
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id number body }
     }
+  }
+}
+"""
 
+_issues = None
 
-def parse_story_from_markdown(content, story_id):
-    """Parse a story's detailed content from markdown."""
-    pattern = rf"## Story {re.escape(story_id)}[:\-\s]+([^\n]+)\n(.*?)(?=\n## Story|\n# EPIC|\Z)"
 
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
-        return None
+def _body_digest(body):
+    return hashlib.blake2b(body.encode(), digest_size=16).digest()
 
-    title = match.group(1).strip()
-    body = match.group(2).strip()
 
-    # Extract just the story description (before first task)
-    task_start = re.search(r'\n### Task', body)
-    if task_start:
-        body = body[:task_start.start()].strip()
+def get_issues():
+    """Return an issue number -> (node id, body digest) map, fetched once.
 
-    return {
-        "story_id": story_id,
-        "title": title,
-        "body": body
-    }
+    The digests let unchanged bodies be skipped without keeping the remote
+    bodies themselves around.
+    """
+    global _issues
+    if _issues is None:
+        _issues = {}
+        variables = {"owner": REPO_OWNER, "name": REPO_NAME, "cursor": None}
+        while True:
+            data = graphql(ISSUES_QUERY, variables)
+            if not data:
+                break
+            issues = data["repository"]["issues"]
+            _issues.update(
+                (node["number"], (node["id"], _body_digest(node["body"] or "")))
+                for node in issues["nodes"]
+            )
+            if not issues["pageInfo"]["hasNextPage"]:
+                break
+            variables["cursor"] = issues["pageInfo"]["endCursor"]
+    return _issues
 
 
-def parse_epic_from_markdown(content, epic_id):
-    """Parse an epic's detailed content from markdown."""
-    pattern = rf"# EPIC \d+[:\-\s]+([^\n]+)\n.*?\*\*ID:\*\* {re.escape(epic_id)}(.*?)(?=\n# EPIC|\Z)"
+def _update_mutation(batch, issues):
+    """Build one aliased updateIssue mutation for a batch of updates.
 
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
+    Returns (query, variables), or None if no issue in the batch is known.
+    """
+    params = []
+    fields = []
+    variables = {}
+    for i, (item_id, issue_number, body) in enumerate(batch):
+        if issue_number not in issues:
+            continue
+        params.append(f"$id{i}: ID!, $b{i}: String")
+        fields.append(
+            f"u{i}: updateIssue(input: {{id: $id{i}, body: $b{i}}}) "
+            f"{{ issue {{ number }} }}"
+        )
+        variables[f"id{i}"] = issues[issue_number][0]
+        variables[f"b{i}"] = body
+    if not fields:
         return None
+    return f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}", variables
 
-    title = match.group(1).strip()
-    body = match.group(2).strip()
 
-    # Extract just epic description (before first story)
-    story_start = re.search(r'\n## Story', body)
-    if story_start:
-        body = body[:story_start.start()].strip()
+def _send_mutation(mutation):
+    """Run one update mutation; None stands for a batch with nothing to send."""
+    return graphql(*mutation) if mutation is not None else None
 
-    return {
-        "epic_id": epic_id,
-        "title": title,
-        "body": body
-    }
 
+def update_issue_bodies(updates):
+    """Replace issue bodies with aliased updateIssue mutations.
 
-def load_all_plans():
-    """Load and concatenate all implementation plan files."""
-    content = ""
-    for plan_file in PLAN_FILES:
-        if plan_file.exists():
-            print(f"Loading {plan_file.name}...")
-            content += plan_file.read_text() + "\n\n"
+    updates is a list of (item_id, issue_number, body) tuples. Issues whose
+    body on GitHub already matches are left alone; the rest are sent
+    GRAPHQL_BATCH_SIZE to a request, several requests at a time.
+    Returns (updated, current): the updates that went through and those
+    that were already up to date.
+    """
+    if not updates:
+        return [], []
+    issues = get_issues()
+    current = []
+    pending = []
+    for update in updates:
+        _, issue_number, body = update
+        remote = issues.get(issue_number)
+        if remote and remote[1] == _body_digest(body):
+            current.append(update)
         else:
-            print(f"Warning: {plan_file.name} not found")
-    return content
+            pending.append(update)
 
+    batches = list(chunks(pending, GRAPHQL_BATCH_SIZE))
+    # _send() keeps at most MAX_CONCURRENT_REQUESTS of these in flight
+    results = worker_pool.map(_send_mutation, [_update_mutation(batch, issues) for batch in batches])
 
-def update_database_descriptions(content):
-    """Update task descriptions in the database."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    updated = []
+    for batch, data in zip(batches, results):
+        data = data or {}
+        for i, update in enumerate(batch):
+            item_id, issue_number, _ = update
+            if data.get(f"u{i}"):
+                print(f"  ✓ {item_id}: #{issue_number} updated")
+                updated.append(update)
+            else:
+                print(f"  ✗ {item_id}: Failed to update #{issue_number}")
+    return updated, current
 
-    # Get all tasks
-    cursor.execute("SELECT id, title FROM tasks")
-    tasks = cursor.fetchall()
 
-    updated = 0
-    for task_id, current_title in tasks:
-        parsed = parse_task_from_markdown(content, task_id)
-        if parsed and parsed["body"]:
-            cursor.execute(
-                "UPDATE tasks SET description = ? WHERE id = ?",
-                (parsed["body"], task_id)
-            )
-            updated += 1
-
-    conn.commit()
-    print(f"Updated {updated} task descriptions in database")
-
-    # Get all stories
-    cursor.execute("SELECT id, title FROM stories")
-    stories = cursor.fetchall()
-
-    updated = 0
-    for story_id, current_title in stories:
-        parsed = parse_story_from_markdown(content, story_id)
-        if parsed and parsed["body"]:
-            cursor.execute(
-                "UPDATE stories SET description = ? WHERE id = ?",
-                (parsed["body"], story_id)
-            )
-            updated += 1
+# Section header lines in the plan files; a section runs until the next
+# header of any kind
+SECTION_RE = re.compile(rb"^(# EPIC |## Story |### Task )(.*)$", re.MULTILINE)
+EPIC, STORY, TASK = b"# EPIC ", b"## Story ", b"### Task "
 
-    conn.commit()
-    print(f"Updated {updated} story descriptions in database")
+# Header text after the marker, e.g. "1: Title", "T1.1.1: Title" or
+# "T1.1.1 - Title"
+EPIC_HEADER_RE = re.compile(r"\d+[:\-\s]+(.+)")
+EPIC_ID_RE = re.compile(r"\*\*ID:\*\* (E\d+)")
+STORY_HEADER_RE = re.compile(r"(S\d+\.\d+)[:\-\s]+(.+)")
+TASK_HEADER_RE = re.compile(r"(T\d+\.\d+\.\d+)[:\-\s]+(.+)")
 
-    conn.close()
 
+def _decode(section):
+    return section.decode("utf-8").replace("\r\n", "\n")
 
-def update_github_issues(content, epic_filter=None):
-    """Update GitHub issues with detailed descriptions."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
 
-    # Build query
-    query = """
-        SELECT t.id, t.title, t.github_issue_number,
-               s.id as story_id, s.title as story_title,
-               e.id as epic_id, e.title as epic_title
-        FROM tasks t
-        JOIN stories s ON t.story_id = s.id
-        JOIN epics e ON s.epic_id = e.id
-        WHERE t.github_issue_number IS NOT NULL
-    """
-    params = []
+def parse_plans(buffers):
+    """Parse the plan files into epic, story and task lookup tables.
 
-    if epic_filter:
-        query += " AND e.id = ?"
-        params.append(epic_filter)
+    buffers are the memory-mapped plan files. Each is scanned once for
+    section headers, and only the bytes of each section are copied out and
+    decoded. Epic and story bodies therefore stop at their first child
+    section. The first occurrence of an id wins.
+    """
+    epics, stories, tasks = {}, {}, {}
+    for buffer in buffers:
+        headers = list(SECTION_RE.finditer(buffer))
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            end = next_header.start() if next_header else len(buffer)
+            kind = header.group(1)
+            text = _decode(header.group(2)).strip()
+            body = _decode(buffer[header.end():end])
+
+            if kind == EPIC:
+                header_match = EPIC_HEADER_RE.match(text)
+                id_match = EPIC_ID_RE.search(body)
+                if header_match and id_match:
+                    epics.setdefault(id_match.group(1), {
+                        "title": header_match.group(1).strip(),
+                        "body": body[id_match.end():].strip()
+                    })
+            elif kind == STORY:
+                header_match = STORY_HEADER_RE.match(text)
+                if header_match:
+                    stories.setdefault(header_match.group(1), {
+                        "title": header_match.group(2).strip(),
+                        "body": body.strip()
+                    })
+            else:
+                header_match = TASK_HEADER_RE.match(text)
+                if not header_match:
+                    continue
+                if next_header and next_header.group(1) == TASK:
+                    # Drop a rule directly above the next task header
+                    body = body.removesuffix("\n").removesuffix("\n---")
+                tasks.setdefault(header_match.group(1), {
+                    "title": header_match.group(2).strip(),
+                    "body": body.strip()
+                })
+
+    return {"epics": epics, "stories": stories, "tasks": tasks}
 
-    query += " ORDER BY t.id"
 
-    cursor.execute(query, params)
-    tasks = cursor.fetchall()
-
-    print(f"\nUpdating {len(tasks)} GitHub issues with detailed descriptions...")
+def load_all_plans():
+    """Memory-map all implementation plan files.
 
-    updated = 0
-    for task in tasks:
-        task_id, title, issue_number, story_id, story_title, epic_id, epic_title = task
+    The OS page cache serves as the read buffer; nothing is copied into
+    Python until parse_plans() slices out a section. The caller closes the
+    returned maps.
+    """
+    buffers = []
+    for plan_file in PLAN_FILES:
+        if plan_file.exists():
+            print(f"Loading {plan_file.name}...")
+            if plan_file.stat().st_size:  # empty files can't be mapped
+                with open(plan_file, "rb") as f:
+                    buffers.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            print(f"Warning: {plan_file.name} not found")
+    return buffers
 
-        parsed = parse_task_from_markdown(content, task_id)
-        if not parsed:
-            print(f"  ⚠ {task_id}: No detailed content found")
-            continue
 
-        # Get subtasks
-        cursor.execute(
-            "SELECT title FROM subtasks WHERE task_id = ? ORDER BY id",
-            (task_id,)
-        )
-        subtasks = [row[0] for row in cursor.fetchall()]
-        subtask_list = "\n".join([f"- [ ] {st}" for st in subtasks]) if subtasks else "No subtasks defined"
+def _plan_cache_key():
+    """Identify the plan files and parser by name, mtime and size."""
+    paths = [Path(__file__), *(p for p in PLAN_FILES if p.exists())]
+    return tuple(
+        (path.name, stat.st_mtime_ns, stat.st_size)
+        for path, stat in ((path, path.stat()) for path in paths)
+    )
 
-        # Build comprehensive issue body
-        body = f"""## {title}
 
-**Epic:** {epic_id} - {epic_title}
-**Story:** {story_id} - {story_title}
+def load_plans():
+    """Return the parsed plan sections, or None if no plan file exists.
 
----
+    The result is pickled to PLAN_CACHE_PATH; later runs reuse it without
+    reading or parsing anything while the cache key still matches.
+    """
+    key = _plan_cache_key()
+    try:
+        with open(PLAN_CACHE_PATH, "rb") as f:
+            cached_key, plans = pickle.load(f)
+        if cached_key == key:
+            print(f"Using parsed plans cached in {PLAN_CACHE_PATH}")
+            return plans
+    except Exception:
+        pass  # missing, truncated or foreign cache file: parse below
+
+    buffers = load_all_plans()
+    if not buffers:
+        return None
+    try:
+        plans = parse_plans(buffers)
+    finally:
+        for buffer in buffers:
+            buffer.close()
 
-{parsed["body"]}
+    try:
+        PLAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = PLAN_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, plans), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, PLAN_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: could not cache parsed plans: {e}")
+    return plans
 
----
 
-### Subtasks Checklist
-{subtask_list}
+# Statements are module constants so every call passes the identical string
+# and reuses the connection's cached prepared statement
+TASK_IDS_SQL = "SELECT id FROM tasks"
+STORY_IDS_SQL = "SELECT id FROM stories"
+UPDATE_TASK_DESCRIPTION_SQL = "UPDATE tasks SET description = ? WHERE id = ?"
+UPDATE_STORY_DESCRIPTION_SQL = "UPDATE stories SET description = ? WHERE id = ?"
 
----
 
-### Tracker Commands
-```bash
-# Start working on this task
-python3 scripts/tracker.py start {task_id}
+def update_database_descriptions(plans):
+    """Update task and story descriptions in the database.
 
-# Mark as complete
-python3 scripts/tracker.py done {task_id}
+    Both tables are written in one BEGIN IMMEDIATE transaction.
+    """
+    conn = get_conn()
+    cursor = conn.cursor()
 
-# Sync to GitHub
-python3 scripts/create_github_issues.py sync
-```
+    # Get all tasks and stories
+    cursor.execute(TASK_IDS_SQL)
+    task_updates = [
+        (parsed["body"], task_id)
+        for (task_id,) in cursor.fetchall()
+        if (parsed := plans["tasks"].get(task_id)) and parsed["body"]
+    ]
+    cursor.execute(STORY_IDS_SQL)
+    story_updates = [
+        (parsed["body"], story_id)
+        for (story_id,) in cursor.fetchall()
+        if (parsed := plans["stories"].get(story_id)) and parsed["body"]
+    ]
 
----
-*See IMPLEMENTATION_PLAN_DETAILED*.md for full technical context.*
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(UPDATE_TASK_DESCRIPTION_SQL, task_updates)
+        cursor.executemany(UPDATE_STORY_DESCRIPTION_SQL, story_updates)
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+    print(f"Updated {len(task_updates)} task descriptions in database")
+    print(f"Updated {len(story_updates)} story descriptions in database")
+
+
+TASK_ISSUES_SQL = """
+    SELECT t.id, t.title, t.github_issue_number,
+           s.id as story_id, s.title as story_title,
+           e.id as epic_id, e.title as epic_title, t.body_hash
+    FROM tasks t
+    JOIN stories s ON t.story_id = s.id
+    JOIN epics e ON s.epic_id = e.id
+    WHERE t.github_issue_number IS NOT NULL
+      AND (:epic IS NULL OR e.id = :epic)
+    ORDER BY t.id
 """
 
-        # Update the issue
-        result = run_gh_command([
-            "issue", "edit", str(issue_number),
-            "--repo", REPO,
-            "--body", body
-        ])
+UPDATE_BODY_HASH_SQL = "UPDATE tasks SET body_hash = ? WHERE id = ?"
 
-        if result is not None:
-            print(f"  ✓ {task_id}: #{issue_number} updated")
-            updated += 1
-        else:
-            print(f"  ✗ {task_id}: Failed to update #{issue_number}")
 
-        time.sleep(0.5)  # Rate limiting
+def _ensure_body_hash_column(conn):
+    """Add tasks.body_hash to databases created before it existed."""
+    try:
+        conn.execute("ALTER TABLE tasks ADD COLUMN body_hash TEXT")
+    except sqlite3.OperationalError:
+        pass  # duplicate column: already migrated
 
-    print(f"\nUpdated {updated}/{len(tasks)} issues")
-    conn.close()
 
+def update_github_issues(plans, epic_filter=None, force=False):
+    """Update GitHub issues with detailed descriptions.
 
-def update_epic_issues(content):
-    """Update epic issues with detailed descriptions."""
-    conn = sqlite3.connect(DB_PATH)
+    The SHA-256 of each body sent is kept in tasks.body_hash, and issues
+    whose rendered body still matches it are skipped unless force is set.
+    The rest are compared with their current body on GitHub before sending.
+    """
+    conn = get_conn()
+    _ensure_body_hash_column(conn)
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT id, title, github_issue_number, description
-        FROM epics
-        WHERE github_issue_number IS NOT NULL
-    """)
-    epics = cursor.fetchall()
+    cursor.execute(TASK_ISSUES_SQL, {"epic": epic_filter or None})
+    tasks = cursor.fetchall()
 
-    print(f"\nUpdating {len(epics)} Epic issues...")
+    subtasks = subtask_titles(conn, [task[0] for task in tasks])
 
-    for epic_id, title, issue_number, current_desc in epics:
-        parsed = parse_epic_from_markdown(content, epic_id)
+    print(f"\nUpdating {len(tasks)} GitHub issues with detailed descriptions...")
 
-        # Get stats
-        cursor.execute("""
-            SELECT COUNT(DISTINCT s.id), COUNT(DISTINCT t.id),
-                   SUM(CASE WHEN t.status = 'DONE' THEN 1 ELSE 0 END)
-            FROM stories s
-            LEFT JOIN tasks t ON t.story_id = s.id
-            WHERE s.epic_id = ?
-        """, (epic_id,))
-        stories, tasks, done_tasks = cursor.fetchone()
+    updates = []
+    hashes = {}
+    unchanged = 0
+    for task in tasks:
+        (task_id, title, issue_number, story_id, story_title,
+         epic_id, epic_title, body_hash) = task
 
-        # Get stories list
-        cursor.execute("""
-            SELECT id, title FROM stories WHERE epic_id = ? ORDER BY id
-        """, (epic_id,))
-        story_list = cursor.fetchall()
+        parsed = plans["tasks"].get(task_id)
+        if not parsed:
+            print(f"  ⚠ {task_id}: No detailed content found")
+            continue
 
-        stories_md = "\n".join([f"- **{s[0]}**: {s[1]}" for s in story_list])
+        subtask_list = "\n".join(
+            f"- [ ] {st}" for st in subtasks.get(task_id, ())
+        ) or "No subtasks defined"
 
-        body = f"""# {title}
+        # Build comprehensive issue body
+        body = TASK_BODY_TEMPLATE.format_map({
+            "title": title,
+            "epic_id": epic_id,
+            "epic_title": epic_title,
+            "story_id": story_id,
+            "story_title": story_title,
+            "description": parsed["body"],
+            "subtask_list": subtask_list,
+            "task_id": task_id,
+        })
+
+        hashes[task_id] = hashlib.sha256(body.encode()).hexdigest()
+        if hashes[task_id] == body_hash and not force:
+            unchanged += 1
+            continue
+        updates.append((task_id, issue_number, body))
+
+    updated, current = update_issue_bodies(updates)
+    if updated or current:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(
+            UPDATE_BODY_HASH_SQL,
+            [(hashes[task_id], task_id) for task_id, _, _ in updated + current]
+        )
+        conn.commit()
 
-## Overview
-{parsed["body"] if parsed else current_desc or "No description"}
+    unchanged += len(current)
+    print(f"\nUpdated {len(updated)}/{len(tasks)} issues ({unchanged} unchanged)")
 
-## Scope
-- **Stories:** {stories}
-- **Tasks:** {tasks}
-- **Completed:** {done_tasks or 0}
-- **Progress:** {(done_tasks or 0) * 100 // tasks if tasks else 0}%
 
-## Stories in this Epic
-{stories_md}
+EPIC_ISSUES_SQL = """
+    SELECT id, title, github_issue_number, description
+    FROM epics
+    WHERE github_issue_number IS NOT NULL
+"""
 
----
+EPIC_STATS_SQL = """
+    SELECT s.epic_id, COUNT(DISTINCT s.id), COUNT(DISTINCT t.id),
+           SUM(CASE WHEN t.status = 'DONE' THEN 1 ELSE 0 END)
+    FROM stories s
+    LEFT JOIN tasks t ON t.story_id = s.id
+    GROUP BY s.epic_id
+"""
 
-### Progress Tracking
-```bash
-# View epic progress
-python3 scripts/tracker.py show {epic_id}
+EPIC_STORIES_SQL = "SELECT epic_id, id, title FROM stories ORDER BY epic_id, id"
 
-# List all tasks
-python3 scripts/tracker.py list tasks --parent S{epic_id[1:]}.1
-```
 
----
-*This issue tracks the overall Epic. Individual tasks have their own issues.*
-"""
+def update_epic_issues(plans):
+    """Update epic issues with detailed descriptions."""
+    conn = get_conn()
+    cursor = conn.cursor()
+
+    cursor.execute(EPIC_ISSUES_SQL)
+    epics = cursor.fetchall()
+
+    # Story/task counts and story lists for every epic, one query each
+    cursor.execute(EPIC_STATS_SQL)
+    stats_by_epic = {row[0]: row[1:] for row in cursor.fetchall()}
+
+    cursor.execute(EPIC_STORIES_SQL)
+    stories_by_epic = {
+        epic_id: [(story_id, story_title) for _, story_id, story_title in group]
+        for epic_id, group in itertools.groupby(cursor.fetchall(), key=lambda row: row[0])
+    }
+
+    print(f"\nUpdating {len(epics)} Epic issues...")
 
-        result = run_gh_command([
-            "issue", "edit", str(issue_number),
-            "--repo", REPO,
-            "--body", body
-        ])
+    updates = []
+    for epic_id, title, issue_number, current_desc in epics:
+        parsed = plans["epics"].get(epic_id)
+        stories, tasks, done_tasks = stats_by_epic.get(epic_id, (0, 0, None))
+        stories_md = "\n".join(
+            f"- **{story_id}**: {story_title}"
+            for story_id, story_title in stories_by_epic.get(epic_id, ())
+        )
 
-        if result is not None:
-            print(f"  ✓ {epic_id}: #{issue_number} updated")
+        body = EPIC_BODY_TEMPLATE.format_map({
+            "title": title,
+            "overview": parsed["body"] if parsed else current_desc or "No description",
+            "stories": stories,
+            "tasks": tasks,
+            "done_tasks": done_tasks or 0,
+            "progress": (done_tasks or 0) * 100 // tasks if tasks else 0,
+            "stories_md": stories_md,
+            "epic_id": epic_id,
+            "first_story": f"S{epic_id[1:]}.1",
+        })
 
-        time.sleep(0.5)
+        updates.append((epic_id, issue_number, body))
 
-    conn.close()
+    updated, current = update_issue_bodies(updates)
+    if current:
+        print(f"  {len(current)} already up to date")
 
 
 def main():
@@ -344,26 +547,28 @@ def main():
     parser.add_argument('command', choices=['database', 'github', 'epics', 'all'],
                        help='What to update')
     parser.add_argument('--epic', '-e', help='Only update specific epic (e.g., E1)')
+    parser.add_argument('--force', '-f', action='store_true',
+                       help='Ignore stored body hashes and check every task issue on GitHub')
 
     args = parser.parse_args()
 
     # Load all plan content
-    content = load_all_plans()
+    plans = load_plans()
 
-    if not content:
+    if plans is None:
         print("Error: No implementation plan files found")
         sys.exit(1)
 
     if args.command == 'database':
-        update_database_descriptions(content)
+        update_database_descriptions(plans)
     elif args.command == 'github':
-        update_github_issues(content, args.epic)
+        update_github_issues(plans, args.epic, args.force)
     elif args.command == 'epics':
-        update_epic_issues(content)
+        update_epic_issues(plans)
     elif args.command == 'all':
-        update_database_descriptions(content)
-        update_epic_issues(content)
-        update_github_issues(content, args.epic)
+        update_database_descriptions(plans)
+        update_epic_issues(plans)
+        update_github_issues(plans, args.epic, args.force)
 
 
 if __name__ == "__main__":